@@ -0,0 +1,117 @@
+import os
+import sys
+import shutil
+import argparse
+import statistics
+import subprocess
+import time
+
+from resume_parser import UNUSED_PIPES, NER_MODEL_DIR
+
+SLIM_SPEC = 'resume_parser_slim.spec'
+SLIM_EXECUTABLE = os.path.join('dist', 'resume_parser_slim', 'resume_parser_slim' + ('.exe' if os.name == 'nt' else ''))
+
+
+def export_ner_model(output_dir):
+    """
+    Save en_core_web_sm with only the NER component to output_dir.
+    """
+    import spacy
+
+    nlp = spacy.load('en_core_web_sm', exclude=UNUSED_PIPES)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    nlp.to_disk(output_dir)
+    print(f"Saved NER-only pipeline {nlp.pipe_names} to {output_dir}")
+
+
+def build():
+    """
+    Export the pruned model and build the slim onedir bundle.
+    """
+    export_ner_model(os.path.join('build', NER_MODEL_DIR))
+    subprocess.run([sys.executable, '-m', 'PyInstaller', '--noconfirm', SLIM_SPEC], check=True)
+
+
+def check_bundle(executable, sample_path=None):
+    """
+    Fail if the bundle lacks the pruned model or spaCy's default config, then
+    parse the sample with it so a bundle that can't load ner_model is caught
+    before the report.
+    """
+    folder = os.path.dirname(os.path.abspath(executable))
+    bundled = set()
+    for root, _, files in os.walk(folder):
+        for filename in files:
+            bundled.add(os.path.relpath(os.path.join(root, filename), folder).replace(os.sep, '/'))
+    for required in (f'{NER_MODEL_DIR}/config.cfg', 'spacy/default_config.cfg'):
+        if not any(path == required or path.endswith('/' + required) for path in bundled):
+            raise RuntimeError(f"{executable} does not contain {required}")
+    if sample_path:
+        time_launch(executable, sample_path, 1)
+    print(f"{executable} contains the NER model and spaCy config" + (" and parsed the sample" if sample_path else ""))
+
+
+def bundle_size(executable):
+    """
+    Size on disk of a build. Onedir builds count their whole folder.
+    """
+    folder = os.path.dirname(os.path.abspath(executable))
+    if os.path.basename(folder) != os.path.splitext(os.path.basename(executable))[0]:
+        return os.path.getsize(executable)
+
+    total = 0
+    for root, _, files in os.walk(folder):
+        for filename in files:
+            total += os.path.getsize(os.path.join(root, filename))
+    return total
+
+
+def time_launch(executable, sample_path, runs):
+    """
+    Launch the app in benchmark mode and return the median seconds until the
+    window is shown and until the first resume is parsed.
+    """
+    env = dict(os.environ, RESUMEAPP_BENCH=os.path.abspath(sample_path))
+    window_times = []
+    parse_times = []
+    for _ in range(runs):
+        start = time.time()
+        result = subprocess.run([executable], env=env, capture_output=True, text=True, timeout=600)
+        marks = dict(line.split() for line in result.stdout.splitlines() if line.startswith(('window_shown', 'first_parse')))
+        if len(marks) != 2:
+            raise RuntimeError(f"{executable} did not report timings:\n{result.stdout}{result.stderr}")
+        window_times.append(float(marks['window_shown']) - start)
+        parse_times.append(float(marks['first_parse']) - start)
+    return statistics.median(window_times), statistics.median(parse_times)
+
+
+def report(builds, sample_path, runs):
+    """
+    Print size, launch-to-window and time-to-first-parse for each build.
+    """
+    print(f"{'Build':<50} {'Size (MB)':>10} {'Window (s)':>11} {'First parse (s)':>16}")
+    for executable in builds:
+        size = bundle_size(executable) / (1024 * 1024)
+        window_time, parse_time = time_launch(executable, sample_path, runs)
+        print(f"{executable:<50} {size:>10.1f} {window_time:>11.2f} {parse_time:>16.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the slim ResumeApp bundle and compare it with the current build.')
+    parser.add_argument('--skip-build', action='store_true', help='only run the report')
+    parser.add_argument('--compare', metavar='EXECUTABLE', help='current build to compare against, e.g. dist/resume_parser/resume_parser')
+    parser.add_argument('--sample', metavar='RESUME_TXT', help='resume text file parsed when timing launches')
+    parser.add_argument('--runs', type=int, default=3, help='launches per build (median is reported)')
+    args = parser.parse_args()
+
+    if not args.skip_build:
+        build()
+        check_bundle(SLIM_EXECUTABLE, args.sample)
+
+    if args.sample:
+        builds = [args.compare, SLIM_EXECUTABLE] if args.compare else [SLIM_EXECUTABLE]
+        report(builds, args.sample, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+import io
+import re
+import csv
+import time
+import queue
+import sqlite3
+import argparse
+from contextlib import contextmanager
+
+# Columns written by resume_parser.py
+CANDIDATE_COLUMNS = [
+    'Name', 'Number', 'Email', 'DOB', 'Gender', 'Pincode', 'Address', 'Qualification',
+    'Specialization', 'Experience', 'Sectors', 'Skills', 'Mark', 'College', 'Year Gap',
+    'Passing Year', 'Preferred Location'
+]
+
+# Phone number columns, as written by resume_parser.py and drive.py
+PHONE_COLUMNS = ('Number', 'Phone')
+
+# Columns of the shared candidates table: the sheet columns plus the extra
+# fields drive.py extracts
+DATABASE_COLUMNS = CANDIDATE_COLUMNS + ['LinkedIn', 'Summary', 'Projects', 'Achievements']
+
+
+def normalize_phone(value):
+    """
+    Digits of a phone number. Numbers read back from Excel are often floats
+    (9876543210.0), so a trailing .0 is not taken as a digit.
+    """
+    if value is None or value != value:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return re.sub(r'\D', '', re.sub(r'\.0+$', '', str(value).strip()))
+
+
+def candidate_key(row, email_column='Email', phone_columns=PHONE_COLUMNS, name_column='Name'):
+    """
+    Normalized key used to upsert a candidate: the lower-cased email, else the
+    last 10 digits of the first phone column set, else the name. None if none
+    is known.
+    """
+    email = row.get(email_column)
+    if isinstance(email, str) and email.strip():
+        return 'email:' + email.strip().lower()
+    for phone_column in phone_columns:
+        phone = normalize_phone(row.get(phone_column))
+        if phone:
+            return 'phone:' + phone[-10:]
+    name = row.get(name_column)
+    if isinstance(name, str) and name.strip():
+        return 'name:' + ' '.join(name.lower().split())
+    return None
+
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def cell(value):
+    # Store everything as text; NaN and empty cells become NULL
+    if value is None or value != value:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+class SQLiteDriver:
+    """
+    SQLite target, used for sqlite:///path/to/file.db URLs.
+    """
+
+    placeholder = '?'
+
+    def __init__(self, url):
+        self.path = url.split('://', 1)[1][1:] or ':memory:'
+        # Every connection to an in-memory database gets its own empty one
+        self.in_memory = self.path == ':memory:'
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def upsert(self, conn, table, columns, rows):
+        names = ', '.join(quote(c) for c in ['candidate_key'] + columns)
+        placeholders = ', '.join('?' for _ in range(len(columns) + 1))
+        updates = ', '.join(f'{quote(c)} = excluded.{quote(c)}' for c in columns)
+        conn.executemany(
+            f'INSERT INTO {quote(table)} ({names}) VALUES ({placeholders}) '
+            f'ON CONFLICT (candidate_key) DO UPDATE SET {updates}',
+            rows
+        )
+
+
+class PostgresDriver:
+    """
+    Postgres target through psycopg2, used for postgresql:// URLs. Batches are
+    loaded with COPY into a temporary table and merged with one upsert.
+    """
+
+    placeholder = '%s'
+
+    def __init__(self, url):
+        try:
+            import psycopg2
+        except ImportError:
+            raise ImportError("psycopg2 is required for Postgres. Install it with: pip install psycopg2-binary")
+        self.psycopg2 = psycopg2
+        self.url = url
+
+    def connect(self):
+        return self.psycopg2.connect(self.url)
+
+    def upsert(self, conn, table, columns, rows):
+        names = ', '.join(quote(c) for c in ['candidate_key'] + columns)
+        updates = ', '.join(f'{quote(c)} = EXCLUDED.{quote(c)}' for c in columns)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            # COPY's CSV format reads an unquoted empty field as NULL
+            writer.writerow(['' if value is None else value for value in row])
+        buffer.seek(0)
+
+        with conn.cursor() as cursor:
+            cursor.execute(f'CREATE TEMP TABLE IF NOT EXISTS candidate_batch (LIKE {quote(table)}) ON COMMIT DELETE ROWS')
+            cursor.copy_expert(f'COPY candidate_batch ({names}) FROM STDIN WITH (FORMAT csv)', buffer)
+            cursor.execute(
+                f'INSERT INTO {quote(table)} ({names}) SELECT {names} FROM candidate_batch '
+                f'ON CONFLICT (candidate_key) DO UPDATE SET {updates}'
+            )
+
+
+# URL scheme -> driver class. Other databases can be added with register_driver().
+DRIVERS = {
+    'sqlite': SQLiteDriver,
+    'postgresql': PostgresDriver,
+    'postgres': PostgresDriver,
+}
+
+
+def register_driver(scheme, driver_class):
+    DRIVERS[scheme] = driver_class
+
+
+class DatabaseSink:
+    """
+    Writes parsed candidates to a database table, next to the Excel sheet.
+
+    Rows are upserted on the normalized key in transactions of batch_size
+    rows. Keep one sink open for a whole session; its connections are pooled
+    so several threads can write through it.
+    """
+
+    def __init__(self, url, table='candidates', columns=DATABASE_COLUMNS, batch_size=1000,
+                 pool_size=4, email_column='Email', phone_columns=PHONE_COLUMNS):
+        scheme = url.split('://', 1)[0]
+        if scheme not in DRIVERS:
+            raise ValueError(f"Unsupported database URL: {url}")
+        self.driver = DRIVERS[scheme](url)
+        self.table = table
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self.email_column = email_column
+        self.phone_columns = phone_columns
+
+        # An in-memory database is only visible to a single connection
+        if getattr(self.driver, 'in_memory', False):
+            pool_size = 1
+        self.pool = queue.Queue()
+        for _ in range(pool_size):
+            self.pool.put(self.driver.connect())
+        self.create_table()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a pooled connection for one transaction.
+        """
+        conn = self.pool.get()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.put(conn)
+
+    def create_table(self):
+        column_defs = ', '.join(f'{quote(c)} TEXT' for c in self.columns)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS {quote(self.table)} (candidate_key TEXT UNIQUE, {column_defs})')
+            # A table created by an older layout gets the columns it lacks
+            cursor.execute(f'SELECT * FROM {quote(self.table)} LIMIT 0')
+            existing = {description[0] for description in cursor.description}
+            for column in self.columns:
+                if column not in existing:
+                    cursor.execute(f'ALTER TABLE {quote(self.table)} ADD COLUMN {quote(column)} TEXT')
+            cursor.close()
+
+    def key(self, row):
+        return candidate_key(row, self.email_column, self.phone_columns)
+
+    def write(self, rows):
+        """
+        Upsert candidate dicts. Returns the number of rows written.
+        Rows with no key at all are plain inserts.
+        """
+        # Keep the last row per key; a single upsert can't touch a row twice
+        keyed = {}
+        unkeyed = []
+        for row in rows:
+            key = self.key(row)
+            values = (key,) + tuple(cell(row.get(c)) for c in self.columns)
+            if key is None:
+                unkeyed.append(values)
+            else:
+                keyed[key] = values
+        records = list(keyed.values()) + unkeyed
+
+        for start in range(0, len(records), self.batch_size):
+            with self.connection() as conn:
+                self.driver.upsert(conn, self.table, self.columns, records[start:start + self.batch_size])
+        return len(records)
+
+    def delete(self, keys):
+        """
+        Remove candidates by key, e.g. after an edit changed their email.
+        """
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            return
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                f'DELETE FROM {quote(self.table)} WHERE candidate_key = {self.driver.placeholder}',
+                [(key,) for key in keys]
+            )
+            cursor.close()
+
+    def close(self):
+        while not self.pool.empty():
+            self.pool.get().close()
+
+
+def benchmark(url, count, batch_size):
+    """
+    Measure sustained insert and upsert throughput with synthetic candidates.
+    """
+    rows = [
+        dict({c: f'{c} {i}' for c in CANDIDATE_COLUMNS}, Email=f'candidate{i}@example.com', Number=f'{9000000000 + i}')
+        for i in range(count)
+    ]
+    sink = DatabaseSink(url, table='candidates_benchmark', batch_size=batch_size)
+    try:
+        for label in ('insert', 'upsert'):
+            start = time.perf_counter()
+            sink.write(rows)
+            elapsed = time.perf_counter() - start
+            print(f"{label}: {count} rows in {elapsed:.2f}s ({count / elapsed:,.0f} rows/s, batch size {batch_size})")
+    finally:
+        sink.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the database sink.')
+    parser.add_argument('url', nargs='?', default='sqlite:///candidates_benchmark.db')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+    benchmark(args.url, args.rows, args.batch_size)
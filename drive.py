@@ -1,8 +1,13 @@
 import os
 import re
+import time
+import sqlite3
 import pandas as pd
 import gdown
 import fitz  # PyMuPDF
+from job_queue import JobQueue, FAILED
+from db_sink import DatabaseSink, DATABASE_COLUMNS
+from search_index import SearchIndex, row_key
 
 # Function to extract data from resume text
 def extract_resume_data(resume_text):
@@ -48,52 +53,147 @@ def download_files_from_drive(drive_links, download_folder):
         file_id = link.split('/')[-2]
         gdown.download(f"https://drive.google.com/uc?export=download&id={file_id}", os.path.join(download_folder, file_id), quiet=False)
 
-# Function to process a folder of resumes
-def process_resumes_folder(folder_path, excel_file_path, sheet_name):
-    # Load the existing Excel sheet
-    sheet_data = pd.read_excel(excel_file_path, sheet_name=sheet_name)
-
-    # Get a list of already processed emails
-    processed_emails = sheet_data['Email'].dropna().unique().tolist()
-
-    # Process each file in the folder
-    for filename in os.listdir(folder_path):
-        file_path = os.path.join(folder_path, filename)
-        
-        # Skip non-PDF and non-TXT files
-        if not (filename.endswith('.pdf') or filename.endswith('.txt')):
-            continue
-
-        try:
-            # Read the resume text based on file type
-            if filename.endswith('.pdf'):
-                with open(file_path, 'rb') as file:
-                    resume_text = read_pdf(file)
-            else:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    resume_text = file.read()
-
-            # Extract data from the resume
-            extracted_data = extract_resume_data(resume_text)
+# Fields extracted here that have a different name in the shared candidates table
+DATABASE_FIELDS = {'Phone': 'Number', 'Location': 'Preferred Location', 'Education': 'Qualification'}
+
+# Function to upsert rows into the ATS database, using the shared table layout
+def write_to_database(rows, sink):
+    database_rows = [{DATABASE_FIELDS.get(field, field): value for field, value in row.items()} for row in rows]
+    written = sink.write(database_rows)
+    print(f"Wrote {written} candidates to the database.")
+
+# Function to merge finished queue results into the Excel sheet (and database).
+# The caller must hold the queue's merge lock.
+def merge_results(queue, excel_file_path, sheet_name, sink):
+    with queue.claim_results() as results:
+        if not results:
+            return 0
+
+        # Load the existing Excel sheet
+        sheet_data = pd.read_excel(excel_file_path, sheet_name=sheet_name)
 
+        # Keys (email, else phone, else name) of the candidates already in
+        # the sheet, so merging the same results twice adds nothing
+        processed_keys = {row_key(row) for row in sheet_data.to_dict('records')}
+
+        new_rows = []
+        for _, extracted_data in results:
             # Check if the resume has already been processed
-            if extracted_data['Email'] in processed_emails:
-                print(f"Resume {filename} already processed. Skipping.")
+            key = row_key(extracted_data)
+            if key is not None and key in processed_keys:
+                print(f"Resume of {key} already processed. Skipping.")
                 continue
+            new_rows.append(extracted_data)
+            processed_keys.add(key)
 
-            # Prepare the data to be appended
-            new_row = pd.DataFrame([extracted_data])
-
-            # Append the new data to the sheet
-            sheet_data = pd.concat([sheet_data, new_row], ignore_index=True)
+        # Upsert into the database first; it is idempotent, so a failure
+        # below leaves nothing that a retried merge would duplicate
+        if sink and new_rows:
+            write_to_database(new_rows, sink)
 
-        except Exception as e:
-            print(f"An error occurred while processing {filename}: {e}")
+        # Append the new data to the sheet
+        if new_rows:
+            sheet_data = pd.concat([sheet_data, pd.DataFrame(new_rows)], ignore_index=True)
 
-    # Save the updated Excel file (overwrite the existing one)
-    sheet_data.to_excel(excel_file_path, sheet_name=sheet_name, index=False)
+        # Save the updated Excel file (overwrite the existing one)
+        sheet_data.to_excel(excel_file_path, sheet_name=sheet_name, index=False)
+        return len(results)
 
-    print("All resumes have been processed and the Excel sheet has been updated.")
+# Function to process a folder of resumes
+def process_resumes_folder(folder_path, excel_file_path, sheet_name, queue_path=None, db_url=None,
+                           index_path=None):
+    # Progress is kept in a job queue next to the resumes, so a crashed or
+    # interrupted run resumes where it stopped and several machines can
+    # drain the same folder by pointing at the same queue file
+    if queue_path is None:
+        queue_path = os.path.join(folder_path, '.resume_queue.sqlite')
+    queue = JobQueue(queue_path)
+    # Search index is updated per resume, so it never needs a full rebuild.
+    # It lives next to the queue, so every worker updates the same index.
+    if index_path is None:
+        index_path = os.path.join(os.path.dirname(os.path.abspath(queue_path)), 'candidates_index.sqlite')
+    search_index = SearchIndex(index_path)
+    # One database sink for the whole run
+    sink = DatabaseSink(db_url, columns=DATABASE_COLUMNS) if db_url else None
+
+    try:
+        # Enqueue every resume in the folder (already known files are ignored)
+        filenames = [f for f in sorted(os.listdir(folder_path)) if f.endswith('.pdf') or f.endswith('.txt')]
+        added = queue.enqueue(filenames)
+        print(f"Queued {added} new resumes.")
+
+        # Process jobs until none are left to lease
+        busy_retries = 0
+        while True:
+            try:
+                job = queue.lease()
+            except sqlite3.OperationalError as e:
+                # The queue stayed locked by another worker; wait and try again
+                busy_retries += 1
+                if busy_retries > 10:
+                    raise
+                print(f"Job queue is busy ({e}). Retrying.")
+                time.sleep(5)
+                continue
+            busy_retries = 0
+            if job is None:
+                break
+            job_id, filename = job
+            file_path = os.path.join(folder_path, filename)
+
+            try:
+                # Read the resume text based on file type
+                if filename.endswith('.pdf'):
+                    with open(file_path, 'rb') as file:
+                        resume_text = read_pdf(file)
+                else:
+                    with open(file_path, 'r', encoding='utf-8') as file:
+                        resume_text = file.read()
+
+                # Extract data from the resume
+                extracted_data = extract_resume_data(resume_text)
+                if queue.complete(job_id, extracted_data):
+                    key = row_key(extracted_data, file_path=file_path)
+                    search_index.add(key, extracted_data, resume_text)
+
+            except KeyboardInterrupt:
+                # Hand the job back so the next run picks it up immediately
+                queue.release(job_id)
+                raise
+            except Exception as e:
+                print(f"An error occurred while processing {filename}: {e}")
+                try:
+                    queue.fail(job_id, e)
+                except sqlite3.OperationalError as lock_error:
+                    # The lease expires on its own and the job is retried then
+                    print(f"Could not record the failure of {filename}: {lock_error}")
+
+        # Other workers are still busy; the last one to finish writes the sheet
+        if not queue.is_drained():
+            print("Other workers are still processing resumes. Leaving the Excel update to them.")
+            return
+
+        # Only one worker at a time rewrites the workbook; wait for a merge in progress
+        with queue.merge_lock(wait_seconds=600) as locked:
+            if not locked:
+                print("Another worker is still updating the Excel sheet. These results are left for the next run.")
+                return
+            # Keep merging while other workers finish jobs meanwhile
+            merged = 0
+            while queue.has_results():
+                merged += merge_results(queue, excel_file_path, sheet_name, sink)
+
+        if not merged:
+            print("No new resumes to add to the Excel sheet.")
+        counts = queue.counts()
+        if counts.get(FAILED):
+            print(f"{counts[FAILED]} resumes failed after {queue.max_attempts} attempts.")
+        print("All resumes have been processed and the Excel sheet has been updated.")
+    finally:
+        queue.close()
+        search_index.close()
+        if sink:
+            sink.close()
 
 # Example usage
 def main():
@@ -106,12 +206,14 @@ def main():
     download_folder = 'downloaded_resumes'
     excel_file_path = 'Bulk Upload Sheet-3.xlsx'
     sheet_name = 'Sheet1'
+    # Database the ATS reads from, e.g. sqlite:///candidates.db (optional)
+    db_url = os.environ.get('RESUME_DB_URL')
 
     # Download files from Google Drive
     download_files_from_drive(drive_links, download_folder)
 
     # Process downloaded resumes
-    process_resumes_folder(download_folder, excel_file_path, sheet_name)
+    process_resumes_folder(download_folder, excel_file_path, sheet_name, db_url=db_url)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,260 @@
+import os
+import json
+import time
+import socket
+import sqlite3
+from contextlib import contextmanager
+
+# Job states
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+MERGING = 'merging'
+MERGED = 'merged'
+
+# Attempts to take the write lock before giving up (each waits up to the connect timeout)
+LOCK_RETRIES = 5
+
+
+class JobQueue:
+    """
+    Durable job queue kept in a local SQLite file.
+
+    Several processes (or hosts sharing the file) can drain the same queue.
+    A worker leases a job for a limited time; if it crashes the lease expires
+    and the job becomes available again. Results are stored with the job so a
+    restarted run keeps the work already done.
+    """
+
+    def __init__(self, db_path, lease_seconds=300, max_attempts=3, worker_id=None, merge_seconds=3600):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.merge_seconds = merge_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+        # Autocommit mode, transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+        # Rollback journal (not WAL) so the file can live on shared storage
+        self.conn.execute('PRAGMA journal_mode=DELETE')
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT,
+                updated REAL
+            )
+            """
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires)')
+        # Named locks with an owner and expiry, e.g. the one serializing merges
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS locks (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)'
+        )
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block inside a write transaction, rolling back on any error.
+        """
+        for attempt in range(LOCK_RETRIES):
+            try:
+                self.conn.execute('BEGIN IMMEDIATE')
+                break
+            except sqlite3.OperationalError as e:
+                # Another worker holds the lock for longer than the timeout
+                if 'locked' not in str(e) or attempt == LOCK_RETRIES - 1:
+                    raise
+                time.sleep(1 + attempt)
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+
+    def enqueue(self, paths):
+        """
+        Add paths to the queue. Paths already known are ignored.
+        Returns the number of new jobs.
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO jobs (path, updated) VALUES (?, ?)',
+                [(path, now) for path in paths]
+            )
+            return conn.total_changes - before
+
+    def lease(self):
+        """
+        Lease the next available job. Returns (job_id, path) or None when
+        nothing is available right now.
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            # Expired leases that used up their attempts are given up on
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = 'lease expired', lease_owner = NULL, updated = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, now, LEASED, now, self.max_attempts)
+            )
+            row = conn.execute(
+                'SELECT id, path FROM jobs '
+                'WHERE (status = ? OR (status = ? AND lease_expires < ?)) AND attempts < ? '
+                'ORDER BY id LIMIT 1',
+                (PENDING, LEASED, now, self.max_attempts)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                'UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, '
+                'lease_expires = ?, updated = ? WHERE id = ?',
+                (LEASED, self.worker_id, now + self.lease_seconds, now, row[0])
+            )
+            return row
+
+    def complete(self, job_id, result):
+        """
+        Mark a leased job as done and store its result.
+        Returns False if the lease was lost to another worker.
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = NULL, lease_owner = NULL, updated = ? '
+                'WHERE id = ? AND status = ? AND lease_owner = ?',
+                (DONE, json.dumps(result), time.time(), job_id, LEASED, self.worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id, error):
+        """
+        Record a failed attempt. The job is retried until it reaches max_attempts.
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, '
+                'error = ?, lease_owner = NULL, lease_expires = NULL, updated = ? '
+                'WHERE id = ? AND status = ? AND lease_owner = ?',
+                (self.max_attempts, FAILED, PENDING, str(error), time.time(), job_id, LEASED, self.worker_id)
+            )
+
+    def release(self, job_id):
+        """
+        Give a leased job back without counting the attempt (e.g. on Ctrl-C).
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, attempts = attempts - 1, lease_owner = NULL, '
+                'lease_expires = NULL, updated = ? WHERE id = ? AND status = ? AND lease_owner = ?',
+                (PENDING, time.time(), job_id, LEASED, self.worker_id)
+            )
+
+    def counts(self):
+        """
+        Return the number of jobs in each state.
+        """
+        rows = self.conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return dict(rows)
+
+    def is_drained(self):
+        """
+        True when no job is pending or leased by any worker.
+        """
+        counts = self.counts()
+        return not counts.get(PENDING) and not counts.get(LEASED)
+
+    def acquire_lock(self, name, seconds):
+        """
+        Take a named lock for this worker unless another worker holds it and
+        it has not expired. Returns True if this worker now holds it.
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            row = conn.execute('SELECT owner, expires FROM locks WHERE name = ?', (name,)).fetchone()
+            if row is not None and row[0] != self.worker_id and row[1] >= now:
+                return False
+            conn.execute(
+                'INSERT OR REPLACE INTO locks (name, owner, expires) VALUES (?, ?, ?)',
+                (name, self.worker_id, now + seconds)
+            )
+            return True
+
+    def release_lock(self, name):
+        with self.transaction() as conn:
+            conn.execute('DELETE FROM locks WHERE name = ? AND owner = ?', (name, self.worker_id))
+
+    @contextmanager
+    def merge_lock(self, wait_seconds=0, poll_seconds=2):
+        """
+        Hold the merge lock for the block, so only one worker at a time reads,
+        updates and rewrites the output. Yields False if the lock could not be
+        taken within wait_seconds; the caller should then leave its results
+        done for the holder or a later run. A crashed holder's lock expires
+        after merge_seconds.
+        """
+        deadline = time.time() + wait_seconds
+        acquired = self.acquire_lock('merge', self.merge_seconds)
+        while not acquired and time.time() < deadline:
+            time.sleep(poll_seconds)
+            acquired = self.acquire_lock('merge', self.merge_seconds)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release_lock('merge')
+
+    def has_results(self):
+        """
+        True when some done jobs are waiting to be merged.
+        """
+        return self.conn.execute('SELECT 1 FROM jobs WHERE status = ? LIMIT 1', (DONE,)).fetchone() is not None
+
+    @contextmanager
+    def claim_results(self):
+        """
+        Yield the results of done jobs as (job_id, result) pairs and mark them
+        merged when the block finishes.
+
+        The jobs are claimed for this worker in a short transaction, so the
+        queue is not locked while the results are written out. Hold
+        merge_lock() around this so two workers never rewrite the output at
+        the same time. If the block raises, the jobs go back to done; if the
+        worker dies, the claim expires after merge_seconds.
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            rows = conn.execute(
+                'SELECT id, result FROM jobs WHERE status = ? OR (status = ? AND lease_expires < ?) ORDER BY id',
+                (DONE, MERGING, now)
+            ).fetchall()
+            conn.executemany(
+                'UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, updated = ? WHERE id = ?',
+                [(MERGING, self.worker_id, now + self.merge_seconds, now, job_id) for job_id, _ in rows]
+            )
+
+        try:
+            yield [(job_id, json.loads(result)) for job_id, result in rows]
+        except BaseException:
+            self._finish_merge(rows, DONE)
+            raise
+        self._finish_merge(rows, MERGED)
+
+    def _finish_merge(self, rows, status):
+        with self.transaction() as conn:
+            conn.executemany(
+                'UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, updated = ? '
+                'WHERE id = ? AND status = ? AND lease_owner = ?',
+                [(status, time.time(), job_id, MERGING, self.worker_id) for job_id, _ in rows]
+            )
@@ -0,0 +1,258 @@
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, pyqtSignal
+from PyQt5.QtGui import QColor
+
+# Rows handed to the view per fetchMore call
+FETCH_BATCH_SIZE = 500
+
+# Background for cells with no extracted value
+MISSING_COLOR = QColor(255, 228, 225)
+
+# Background for extracted values worth checking by hand
+LOW_CONFIDENCE_COLOR = QColor(255, 243, 205)
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Table model over the sheet data frame.
+
+    Rows are handed to the view in batches as it scrolls, and only the cells
+    on screen are ever converted for display. Filtering and sorting work on an
+    array of row positions, so the frame itself is never copied. Edits are
+    kept aside until they are saved in one batch (see edits_by_row()).
+    """
+
+    def __init__(self, sheet_data=None, parent=None):
+        super().__init__(parent)
+        self.set_sheet_data(sheet_data if sheet_data is not None else pd.DataFrame())
+
+    def set_sheet_data(self, sheet_data):
+        """
+        Replace the data shown by the model.
+        """
+        self.beginResetModel()
+        self.sheet_data = sheet_data.reset_index(drop=True)
+        self.columns = list(self.sheet_data.columns)
+        self.pending_edits = {}
+        self.cell_notes = {}
+        self.filter_text = ''
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+        # Lower-cased text of each row, built on the first filter
+        self._search_text = None
+        # Rows the filter starts from (all rows unless a search narrowed them)
+        self._base_rows = None
+        self._rows = np.arange(len(self.sheet_data))
+        self._fetched = min(FETCH_BATCH_SIZE, len(self._rows))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._fetched
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._fetched < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, len(self._rows) - self._fetched)
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def value(self, row, column):
+        """
+        Current value of a cell, including edits not yet written back.
+        """
+        position = self._rows[row]
+        if (position, column) in self.pending_edits:
+            return self.pending_edits[(position, column)]
+        return self.sheet_data.iat[position, column]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        value = self.value(index.row(), index.column())
+        missing = value is None or (not isinstance(value, str) and pd.isna(value))
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return '' if missing else str(value)
+        if role == Qt.BackgroundRole and missing:
+            return MISSING_COLOR
+
+        note = self.cell_notes.get((self._rows[index.row()], index.column()))
+        if note and role == Qt.BackgroundRole:
+            return LOW_CONFIDENCE_COLOR
+        if note and role == Qt.ToolTipRole:
+            return note
+        return None
+
+    def set_cell_notes(self, notes):
+        """
+        Highlight cells with a tooltip, e.g. values extracted with low confidence.
+        notes maps (row position, column name) to the tooltip text.
+        """
+        self.beginResetModel()
+        self.cell_notes = {
+            (position, self.columns.index(column)): note
+            for (position, column), note in notes.items() if column in self.columns
+        }
+        self.endResetModel()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self.columns[section])
+        return str(self._rows[section] + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        value = value.strip() if isinstance(value, str) else value
+        position = self._rows[index.row()]
+        self.pending_edits[(position, index.column())] = value or None
+        # A value fixed by hand no longer needs checking
+        self.cell_notes.pop((position, index.column()), None)
+        # Keep the cached filter text current for just this row
+        if self._search_text is not None:
+            self._search_text.iat[position] = self._row_search_text(position)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.BackgroundRole])
+        return True
+
+    def edits_by_row(self):
+        """
+        Pending edits as {row position: {column name: value}}, by row position.
+        """
+        edits = {}
+        for (position, column), value in sorted(self.pending_edits.items()):
+            edits.setdefault(position, {})[self.columns[column]] = value
+        return edits
+
+    def set_filter(self, text):
+        """
+        Show only rows containing text in any column. When the new text extends
+        the previous one, only the rows still shown are searched again.
+        """
+        text = text.strip().lower()
+        if text == self.filter_text:
+            return
+
+        if self._search_text is None:
+            self._search_text = self._build_search_text()
+
+        if self.filter_text and text.startswith(self.filter_text):
+            candidates = self._rows
+        else:
+            candidates = self._base_rows if self._base_rows is not None else np.arange(len(self.sheet_data))
+            if self.sort_column is not None:
+                candidates = self._sorted(candidates)
+
+        if text:
+            mask = self._search_text.iloc[candidates].str.contains(text, regex=False).to_numpy()
+            candidates = candidates[mask]
+
+        self.filter_text = text
+        self._show_rows(candidates)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # The view asks to sort as soon as sorting is enabled, even with no columns yet
+        if column < 0 or column >= len(self.columns):
+            self.sort_column = None
+            self.sort_order = order
+            return
+        self.sort_column = column
+        self.sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        self._rows = self._sorted(self._rows)
+        self.layoutChanged.emit()
+
+    def show_positions(self, positions):
+        """
+        Show only the given row positions, in the given order, or every row
+        when positions is None. The filter then applies within these rows.
+        """
+        self.filter_text = ''
+        self._base_rows = None if positions is None else np.asarray(positions, dtype=int)
+        self._show_rows(self._base_rows if positions is not None else np.arange(len(self.sheet_data)))
+
+    def _sorted(self, rows):
+        # Current values, including edits not yet saved
+        values = self.sheet_data.iloc[:, self.sort_column]
+        edits = {position: value for (position, column), value in self.pending_edits.items() if column == self.sort_column}
+        if edits:
+            values = values.astype(object)
+            for position, value in edits.items():
+                values.iat[position] = value
+        values = values.iloc[rows]
+
+        # Empty cells go last in either order
+        missing = (values.isna() | (values.astype(str).str.strip() == '')).to_numpy()
+        present = values[~missing]
+        # Numbers (including numbers typed in as text) sort by value, anything else as text
+        numbers = pd.to_numeric(present, errors='coerce')
+        keys = numbers if numbers.notna().all() else present.astype(str).str.lower()
+        order = np.argsort(keys.to_numpy(), kind='stable')
+        if self.sort_order == Qt.DescendingOrder:
+            order = order[::-1]
+        return np.concatenate([rows[~missing][order], rows[missing]])
+
+    def _show_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._fetched = min(FETCH_BATCH_SIZE, len(rows))
+        self.endResetModel()
+
+    def _build_search_text(self):
+        search_text = self.sheet_data.fillna('').astype(str).agg(' '.join, axis=1).str.lower()
+        for position in {position for position, _ in self.pending_edits}:
+            search_text.iat[position] = self._row_search_text(position)
+        return search_text
+
+    def _row_search_text(self, position):
+        values = []
+        for column in range(len(self.columns)):
+            value = self.pending_edits.get((position, column), self.sheet_data.iat[position, column])
+            missing = value is None or (not isinstance(value, str) and pd.isna(value))
+            values.append('' if missing else str(value))
+        return ' '.join(values).lower()
+
+
+class SheetLoader(QThread):
+    """
+    Reads the Excel sheet in a background thread so the window stays responsive.
+    """
+
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, excel_file_path, sheet_name, parent=None):
+        super().__init__(parent)
+        self.excel_file_path = excel_file_path
+        self.sheet_name = sheet_name
+
+    def run(self):
+        try:
+            sheet_data = pd.read_excel(self.excel_file_path, sheet_name=self.sheet_name)
+        except FileNotFoundError:
+            self.failed.emit("No Excel sheet found.")
+        except Exception as e:
+            self.failed.emit(f"An error occurred while loading the Excel sheet: {e}")
+        else:
+            self.loaded.emit(sheet_data)
@@ -1,14 +1,67 @@
 import sys
 import os
 import re
+import time
 import pandas as pd
 import fitz  # PyMuPDF
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QPushButton, QFileDialog, QLabel, QVBoxLayout, QWidget, QDesktopWidget, QHBoxLayout
+    QApplication, QMainWindow, QPushButton, QFileDialog, QLabel, QVBoxLayout, QWidget, QDesktopWidget, QHBoxLayout,
+    QLineEdit, QTableView, QMessageBox
 )
+from PyQt5.QtCore import QTimer
 from PyQt5.QtGui import QIcon, QFont
 from io import StringIO
-import spacy
+from results_model import ResultsTableModel, SheetLoader
+from db_sink import DatabaseSink, DATABASE_COLUMNS
+from search_index import SearchIndex, row_key
+
+# Only the NER component is used (for names); the rest of en_core_web_sm is skipped
+UNUSED_PIPES = ['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter']
+
+# Folder holding the pruned NER-only model in frozen builds
+NER_MODEL_DIR = 'ner_model'
+
+# One threshold for trusting an extracted value: names found by the cheap
+# heuristics below it are checked with spaCy, and values still below it
+# are highlighted in the results pane
+CONFIDENCE_THRESHOLD = 0.7
+
+# A "Name: ..." label with the name on the same line
+NAME_LABEL_PATTERN = re.compile(r"^[ \t]*(?:Full[ \t]+)?Name[ \t]*[:\-][ \t]*([A-Za-z][A-Za-z .'-]*?)[ \t]*\r?$", re.IGNORECASE | re.MULTILINE)
+NAME_WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z.'-]*")
+
+# Titles that may precede a name; they are dropped from the value
+HONORIFICS = {'mr', 'mr.', 'mrs', 'mrs.', 'ms', 'ms.', 'miss', 'dr', 'dr.', 'shri', 'smt', 'smt.'}
+
+# Lines at the top of a resume searched first for the name
+HEADER_LINES = 10
+
+# Words that mark a title, section heading or job title rather than a name
+HEADER_WORDS = {
+    'resume', 'curriculum', 'vitae', 'cv', 'biodata', 'bio-data', 'profile', 'summary', 'objective',
+    'career', 'personal', 'details', 'contact', 'information', 'info', 'about', 'me', 'professional',
+    'experience', 'education', 'qualification', 'qualifications', 'skills', 'technical', 'projects',
+    'achievements', 'declaration', 'address', 'work', 'history', 'employment', 'academic',
+    'engineer', 'developer', 'manager', 'analyst', 'consultant', 'designer', 'intern', 'executive',
+    'software', 'senior', 'junior', 'lead', 'associate', 'assistant', 'officer', 'specialist',
+    'fresher', 'graduate', 'student', 'scientist', 'administrator', 'architect', 'accountant',
+}
+
+# Words that mark a place or a degree rather than a name
+PLACE_AND_DEGREE_WORDS = {
+    'india', 'city', 'state', 'district', 'nagar', 'road', 'street', 'colony', 'sector', 'village',
+    'mumbai', 'delhi', 'bangalore', 'bengaluru', 'chennai', 'kolkata', 'hyderabad', 'pune', 'ahmedabad',
+    'jaipur', 'lucknow', 'noida', 'gurgaon', 'gurugram', 'bhubaneswar', 'kochi', 'indore', 'nagpur',
+    'maharashtra', 'karnataka', 'odisha', 'orissa', 'kerala', 'gujarat', 'rajasthan', 'punjab', 'haryana',
+    'bihar', 'assam', 'telangana', 'tamil', 'nadu', 'uttar', 'pradesh', 'andhra', 'bengal', 'madhya',
+    'bachelor', 'bachelors', 'master', 'masters', 'degree', 'diploma', 'technology', 'engineering',
+    'science', 'arts', 'commerce', 'computer', 'applications', 'b.tech', 'm.tech', 'b.e', 'b.sc',
+    'm.sc', 'mba', 'bca', 'mca', 'b.com', 'university', 'college', 'institute', 'school',
+}
+
+# Most search results shown in the results pane
+SEARCH_LIMIT = 1000
+
 
 class ResumeApp(QMainWindow):
     def __init__(self):
@@ -35,18 +88,52 @@ class ResumeApp(QMainWindow):
         self.update_button.setIcon(QIcon('icons/update.png'))
         self.update_button.clicked.connect(self.update_sheet)
 
+        self.view_button = QPushButton('View Sheet')
+        self.view_button.clicked.connect(self.view_sheet)
+
+        self.save_edits_button = QPushButton('Save Edits')
+        self.save_edits_button.setEnabled(False)
+        self.save_edits_button.clicked.connect(self.save_edits)
+
         self.status_label = QLabel('')
         self.status_label.setFont(QFont('Arial', 12))
 
+        # Results pane: filter box and a table that only renders visible rows
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText('Search candidates, e.g. skills:python AND location:bangalore AND year:2022')
+        self.search_edit.returnPressed.connect(self.search_candidates)
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText('Filter results...')
+        self.filter_edit.textChanged.connect(self.schedule_filter)
+
+        # Apply the filter once typing pauses instead of on every key press
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(200)
+        self.filter_timer.timeout.connect(self.apply_filter)
+
+        self.results_model = ResultsTableModel()
+        self.results_model.dataChanged.connect(self.edits_changed)
+        self.results_view = QTableView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setSortingEnabled(True)
+        self.results_view.verticalHeader().setDefaultSectionSize(22)
+
         # Add buttons to a horizontal layout
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.upload_button)
         button_layout.addWidget(self.upload_folder_button)
         button_layout.addWidget(self.update_button)
+        button_layout.addWidget(self.view_button)
+        button_layout.addWidget(self.save_edits_button)
 
         # Add layouts to the main layout
         main_layout.addLayout(button_layout)
         main_layout.addWidget(self.status_label)
+        main_layout.addWidget(self.search_edit)
+        main_layout.addWidget(self.filter_edit)
+        main_layout.addWidget(self.results_view)
 
         # Set layout to the central widget
         container = QWidget()
@@ -56,8 +143,31 @@ class ResumeApp(QMainWindow):
         # Initialize the list to store resume files
         self.resume_files = []
 
-        # Load NLP model
-        self.nlp = spacy.load('en_core_web_sm')
+        self.excel_file_path = 'Bulk Upload Sheet-3.xlsx'
+        self.sheet_name = 'Sheet1'
+
+        # Inverted index over ingested candidates, updated as resumes are added
+        self.search_index = SearchIndex('candidates_index.sqlite')
+        self._row_positions = None
+        # Whether the results pane holds the sheet (it may have no rows)
+        self.sheet_shown = False
+
+        # ATS database sink, opened on first write and kept for the session
+        self._db_sink = None
+
+        # Background sheet loading, and what to run once the sheet is in
+        self.sheet_loader = None
+        self.after_sheet_loaded = None
+
+        # The NLP model is loaded on first use so the window appears quickly
+        self._nlp = None
+        self.reset_extraction_stats()
+
+    @property
+    def nlp(self):
+        if self._nlp is None:
+            self._nlp = load_nlp()
+        return self._nlp
 
     def center(self):
         """
@@ -96,9 +206,11 @@ class ResumeApp(QMainWindow):
         if not self.resume_files:
             self.status_label.setText("No resumes uploaded.")
             return
+        if not self.confirm_pending_edits():
+            return
 
-        excel_file_path = 'Bulk Upload Sheet-3.xlsx'
-        sheet_name = 'Sheet1'
+        excel_file_path = self.excel_file_path
+        sheet_name = self.sheet_name
 
         try:
             sheet_data = pd.read_excel(excel_file_path, sheet_name=sheet_name)
@@ -108,6 +220,11 @@ class ResumeApp(QMainWindow):
         # Get a list of already processed emails
         processed_emails = sheet_data['Email'].dropna().unique().tolist()
 
+        self.reset_extraction_stats()
+        # (sheet position, column) -> note for values worth checking by hand
+        low_confidence = {}
+        new_rows = []
+        index_items = []
         for file_path in self.resume_files:
             try:
                 if file_path.endswith('.pdf'):
@@ -118,7 +235,8 @@ class ResumeApp(QMainWindow):
                         resume_text = file.read()
 
                 # Extract data from the resume
-                extracted_data = self.extract_resume_data(resume_text)
+                fields = self.extract_resume_fields(resume_text)
+                extracted_data = {field: value for field, (value, _, _) in fields.items()}
 
                 # Check if the resume has already been processed
                 if extracted_data['Email'] in processed_emails:
@@ -128,41 +246,409 @@ class ResumeApp(QMainWindow):
                 # Append the new data to the sheet
                 new_row = pd.DataFrame([extracted_data])
                 sheet_data = pd.concat([sheet_data, new_row], ignore_index=True)
+                new_rows.append(extracted_data)
+                for field, (value, source, confidence) in fields.items():
+                    if value and confidence < CONFIDENCE_THRESHOLD:
+                        low_confidence[(len(sheet_data) - 1, field)] = f"From {source} (confidence {confidence:.2f})"
+                key = row_key(extracted_data, len(sheet_data) - 1)
+                index_items.append((key, extracted_data, resume_text))
             except Exception as e:
                 print(f"An error occurred while processing {os.path.basename(file_path)}: {e}")
 
         # Save the updated Excel file
         sheet_data.to_excel(excel_file_path, sheet_name=sheet_name, index=False)
-        self.status_label.setText("All resumes have been processed and the Excel sheet has been updated.")
+        self.write_to_database(new_rows)
+        self.search_index.add_many(index_items)
+        report = self.extraction_report()
+        print(report)
+        self.status_label.setText(f"All resumes have been processed and the Excel sheet has been updated.\n{report}")
         self.resume_files = []
+        self.show_results(sheet_data)
+        self.results_model.set_cell_notes(low_confidence)
+
+    def view_sheet(self, after_loaded=None):
+        """
+        Load the Excel sheet into the results pane. The workbook is read in a
+        background thread; after_loaded is called once it is shown.
+        """
+        if self.sheet_loader is not None and self.sheet_loader.isRunning():
+            return
+        if not self.confirm_pending_edits():
+            return
+        self.after_sheet_loaded = after_loaded
+        self.view_button.setEnabled(False)
+        self.status_label.setText("Loading the Excel sheet...")
+        self.sheet_loader = SheetLoader(self.excel_file_path, self.sheet_name, self)
+        self.sheet_loader.loaded.connect(self.sheet_loaded)
+        self.sheet_loader.failed.connect(self.sheet_load_failed)
+        self.sheet_loader.start()
+
+    def sheet_loaded(self, sheet_data):
+        self.view_button.setEnabled(True)
+        self.show_results(sheet_data)
+        self.status_label.setText(f"Loaded {len(sheet_data)} candidates.")
+        if self.after_sheet_loaded:
+            callback, self.after_sheet_loaded = self.after_sheet_loaded, None
+            callback()
+
+    def sheet_load_failed(self, message):
+        self.view_button.setEnabled(True)
+        self.after_sheet_loaded = None
+        self.status_label.setText(message)
+
+    def show_results(self, sheet_data):
+        """
+        Show sheet data in the results pane, keeping the current filter.
+        """
+        self.results_model.set_sheet_data(sheet_data)
+        self._row_positions = None
+        self.sheet_shown = True
+        self.save_edits_button.setEnabled(False)
+        self.apply_filter()
+
+    def schedule_filter(self):
+        self.filter_timer.start()
+
+    def apply_filter(self):
+        self.results_model.set_filter(self.filter_edit.text())
+
+    def edits_changed(self):
+        self.save_edits_button.setEnabled(bool(self.results_model.pending_edits))
+
+    def confirm_pending_edits(self):
+        """
+        Before the results pane is reloaded, offer to save unsaved edits.
+        Returns False if the user cancelled.
+        """
+        if not self.results_model.pending_edits:
+            return True
+        answer = QMessageBox.question(
+            self, "Unsaved edits", "Save your edits to the Excel sheet before reloading it?",
+            QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel, QMessageBox.Save
+        )
+        if answer == QMessageBox.Cancel:
+            return False
+        if answer == QMessageBox.Save:
+            return self.save_edits()
+        # Discarded edits are dropped when the sheet is shown again
+        return True
+
+    def save_edits(self):
+        """
+        Write the edits made in the results pane back to the Excel sheet in one go.
+
+        The workbook is read again first and the edits are applied to the rows
+        with the same keys, so rows added meanwhile (e.g. by drive.py) are kept.
+        Returns False if the sheet could not be saved.
+        """
+        model = self.results_model
+        edits = model.edits_by_row()
+        # Keys before the edits, in case an edit changes the email, number or name
+        original_rows = model.sheet_data.iloc[sorted(edits)].to_dict('records')
+
+        try:
+            sheet_data = pd.read_excel(self.excel_file_path, sheet_name=self.sheet_name)
+        except FileNotFoundError:
+            sheet_data = model.sheet_data.copy()
+        except Exception as e:
+            self.status_label.setText(f"An error occurred while reading the Excel sheet: {e}")
+            return False
+
+        positions = {}
+        for position, row in enumerate(sheet_data.to_dict('records')):
+            positions.setdefault(row_key(row, position), position)
+
+        edited_positions = []
+        edited_originals = []
+        missing = 0
+        for original, (position, row_edits) in zip(original_rows, sorted(edits.items())):
+            sheet_position = positions.get(row_key(original, position))
+            if sheet_position is None:
+                missing += 1
+                continue
+            for column, value in row_edits.items():
+                if column not in sheet_data.columns:
+                    sheet_data[column] = None
+                elif value is not None and sheet_data[column].dtype != object:
+                    sheet_data[column] = sheet_data[column].astype(object)
+                sheet_data.at[sheet_position, column] = value
+            edited_positions.append(sheet_position)
+            edited_originals.append(original)
+
+        try:
+            sheet_data.to_excel(self.excel_file_path, sheet_name=self.sheet_name, index=False)
+        except Exception as e:
+            self.status_label.setText(f"An error occurred while saving the Excel sheet: {e}")
+            return False
+
+        edited_rows = sheet_data.iloc[edited_positions].to_dict('records')
+        self.write_to_database(edited_rows, edited_originals)
+        self.reindex_rows(edited_positions, edited_originals, edited_rows)
+
+        changed = sum(len(row_edits) for row_edits in edits.values())
+        self.show_results(sheet_data)
+        if self.search_edit.text().strip():
+            self.search_candidates()
+        message = f"Saved {changed} edited cells to the Excel sheet."
+        if missing:
+            message += f" {missing} edited rows are no longer in the sheet and were skipped."
+        self.status_label.setText(message)
+        return True
+
+    def search_candidates(self):
+        """
+        Run the search box query against the index and show the matching
+        rows in the results pane, best match first.
+        """
+        query = self.search_edit.text().strip()
+        if not self.sheet_shown:
+            # Search once the sheet has been loaded
+            self.view_sheet(after_loaded=self.search_candidates)
+            return
+        if not query:
+            self.results_model.show_positions(None)
+            self.apply_filter()
+            return
+
+        try:
+            keys = self.search_index.search(query, limit=SEARCH_LIMIT)
+            total = self.search_index.count(query) if len(keys) == SEARCH_LIMIT else len(keys)
+        except ValueError as e:
+            self.status_label.setText(str(e))
+            return
+
+        # Sheet position of each candidate key, built once per loaded sheet
+        # with the same keys the rows were indexed under
+        if self._row_positions is None:
+            self._row_positions = {}
+            for position, row in enumerate(self.results_model.sheet_data.to_dict('records')):
+                self._row_positions.setdefault(row_key(row, position), position)
+        positions = [self._row_positions[key] for key in keys if key in self._row_positions]
+
+        self.results_model.show_positions(positions)
+        self.apply_filter()
+        if total > len(keys):
+            self.status_label.setText(f"{total} candidates match the search; showing the best {len(positions)}.")
+        else:
+            self.status_label.setText(f"{len(positions)} candidates match the search.")
+
+    def reindex_rows(self, positions, original_rows, rows):
+        """
+        Update the search index for edited rows, moving candidates whose key
+        changed so their resume text is kept.
+        """
+        items = []
+        for position, original, row in zip(positions, original_rows, rows):
+            old_key, new_key = row_key(original, position), row_key(row, position)
+            if old_key != new_key:
+                self.search_index.rename(old_key, new_key)
+            items.append((new_key, row, None))
+        self.search_index.add_many(items)
+        self._row_positions = None
+
+    @property
+    def db_sink(self):
+        """
+        Sink for the ATS database named by RESUME_DB_URL (e.g. sqlite:///candidates.db
+        or postgresql://user@host/ats), or None when it is not set.
+        """
+        db_url = os.environ.get('RESUME_DB_URL')
+        if self._db_sink is None and db_url:
+            self._db_sink = DatabaseSink(db_url, columns=DATABASE_COLUMNS, pool_size=1)
+        return self._db_sink
+
+    def write_to_database(self, rows, original_rows=None):
+        """
+        Upsert rows into the ATS database. For edited rows, original_rows holds
+        the same rows before the edit: candidates whose key changed are moved,
+        and rows with no key at all are skipped since they can't be matched.
+        """
+        if not rows:
+            return
+        try:
+            sink = self.db_sink
+            if sink is None:
+                return
+            if original_rows is not None:
+                old_keys = [sink.key(original) for original in original_rows]
+                sink.delete([old for old, row in zip(old_keys, rows) if old and old != sink.key(row)])
+                rows = [row for row in rows if sink.key(row)]
+            sink.write(rows)
+        except Exception as e:
+            print(f"An error occurred while writing to the database: {e}")
+
+    def closeEvent(self, event):
+        if self._db_sink is not None:
+            self._db_sink.close()
+        self.search_index.close()
+        super().closeEvent(event)
 
     def extract_resume_data(self, resume_text):
         """
         Extract data from resume text using NLP and regex patterns.
         """
-        doc = self.nlp(resume_text)
-
-        extracted_data = {
-            'Name': self.extract_name(doc),
-            'Number': self.extract_phone_number(resume_text),
-            'Email': self.extract_email(resume_text),
-            'DOB': self.extract_dob(resume_text),
-            'Gender': self.extract_gender(resume_text),
-            'Pincode': self.extract_pincode(resume_text),
-            'Address': self.extract_address(resume_text),
-            'Qualification': self.extract_qualification(resume_text),
-            'Specialization': self.extract_specialization(resume_text),
-            'Experience': self.extract_experience(resume_text),
-            'Sectors': self.extract_sectors(resume_text),
-            'Skills': self.extract_skills(resume_text),
-            'Mark': self.extract_mark(resume_text),
-            'College': self.extract_college(resume_text),
-            'Year Gap': self.extract_year_gap(resume_text),
-            'Passing Year': self.extract_passing_year(resume_text),
-            'Preferred Location': self.extract_preferred_location(resume_text)
+        fields = self.extract_resume_fields(resume_text)
+        return {field: value for field, (value, _, _) in fields.items()}
+
+    def extract_resume_fields(self, resume_text):
+        """
+        Extract every field along with where it came from.
+        Returns {field: (value, source, confidence)}; source is None when nothing was found.
+        """
+        regex_extractors = {
+            'Number': self.extract_phone_number,
+            'Email': self.extract_email,
+            'DOB': self.extract_dob,
+            'Gender': self.extract_gender,
+            'Pincode': self.extract_pincode,
+            'Address': self.extract_address,
+            'Qualification': self.extract_qualification,
+            'Specialization': self.extract_specialization,
+            'Experience': self.extract_experience,
+            'Sectors': self.extract_sectors,
+            'Skills': self.extract_skills,
+            'Mark': self.extract_mark,
+            'College': self.extract_college,
+            'Year Gap': self.extract_year_gap,
+            'Passing Year': self.extract_passing_year,
+            'Preferred Location': self.extract_preferred_location
         }
+        regex_fields = {}
+        for field, extractor in regex_extractors.items():
+            value = extractor(resume_text)
+            regex_fields[field] = (value, 'regex', 1.0) if value else (None, None, 0.0)
+
+        fields = {'Name': self.extract_name_tiered(resume_text, regex_fields)}
+        fields.update(regex_fields)
+
+        return fields
+
+    def extract_name_tiered(self, text, fields=None):
+        """
+        Find the name with the cheapest method that is confident enough:
+        a "Name:" label near the top, the first line of the resume, a "Name:"
+        label further down, then spaCy NER. fields are the other values already
+        extracted, used as evidence. Returns (name, source, confidence).
+        """
+        fields = fields or {}
+        header = '\n'.join(text.splitlines()[:HEADER_LINES])
+        name = self.extract_name_from_label(header)
+        if name:
+            self.name_tiers['label'] += 1
+            return name, 'label', 0.95
+
+        header_name, header_confidence = self.extract_name_from_header(text, fields)
+        if header_name and header_confidence >= CONFIDENCE_THRESHOLD:
+            self.name_tiers['header'] += 1
+            return header_name, 'header', header_confidence
+
+        name = self.extract_name_from_label(text)
+        if name:
+            self.name_tiers['label'] += 1
+            return name, 'label', 0.9
+
+        # Load the model before timing so the estimate covers parsing only
+        nlp = self.nlp
+        start = time.perf_counter()
+        name = self.extract_name(nlp(text))
+        self.ner_seconds += time.perf_counter() - start
+        self.ner_calls += 1
+        if name:
+            self.name_tiers['ner'] += 1
+            return name, 'ner', 0.8
+
+        # spaCy found nothing, so a weak header guess is better than no name
+        if header_name:
+            self.name_tiers['header'] += 1
+            return header_name, 'header', header_confidence
+        self.name_tiers['none'] += 1
+        return None, None, 0.0
+
+    def extract_name_from_label(self, text):
+        """
+        Value of the first "Name: ..." label that isn't a heading or a place.
+        """
+        for match in NAME_LABEL_PATTERN.finditer(text):
+            words = self.strip_honorifics(match.group(1).split())
+            if words and not self.is_heading(words):
+                return ' '.join(words)
+        return None
 
-        return extracted_data
+    def extract_name_from_header(self, text, fields=None):
+        """
+        Treat the first non-empty line as the name if it looks like one,
+        skipping title lines such as "RESUME". Returns (name, confidence).
+
+        A line shaped like a name scores 0.5. Capitalised words, a title such
+        as "Mr.", the name appearing in the email address and contact details
+        on the lines below each add to that; a line with heading, place or
+        degree words, or equal to another extracted field, is not a name.
+        """
+        fields = fields or {}
+        lines = [line.strip() for line in text.splitlines()[:HEADER_LINES] if line.strip()]
+        for index, line in enumerate(lines[:3]):
+            words = line.split()
+            if all(word.lower().strip(':') in HEADER_WORDS for word in words):
+                continue
+            name_words = self.strip_honorifics(words)
+            if not 2 <= len(name_words) <= 4 or not all(NAME_WORD_PATTERN.fullmatch(word) for word in name_words):
+                return None, 0.0
+            # Headings, job titles, places and degrees ("Software Engineer", "Mumbai Maharashtra")
+            if self.is_heading(name_words):
+                return None, 0.0
+            name = ' '.join(name_words)
+            other_values = {str(value).strip().lower() for value, _, _ in fields.values() if value}
+            if name.lower() in other_values or line.lower() in other_values:
+                return None, 0.0
+
+            confidence = 0.5
+            if all(word[0].isupper() for word in name_words):
+                confidence += 0.1
+            if len(name_words) < len(words):
+                confidence += 0.1
+            email = fields.get('Email', (None,))[0]
+            local_part = email.split('@')[0].lower() if email else ''
+            if any(len(word) > 2 and word.lower().strip(".'-") in local_part for word in name_words):
+                confidence += 0.2
+            contact = [str(fields[field][0]) for field in ('Email', 'Number') if fields.get(field, (None,))[0]]
+            following = ' '.join(lines[index + 1:index + 4])
+            if any(value in following for value in contact):
+                confidence += 0.1
+            return name, round(min(confidence, 0.95), 2)
+        return None, 0.0
+
+    @staticmethod
+    def strip_honorifics(words):
+        while words and words[0].lower() in HONORIFICS:
+            words = words[1:]
+        return words
+
+    @staticmethod
+    def is_heading(words):
+        return any(word.lower().strip(":,") in HEADER_WORDS | PLACE_AND_DEGREE_WORDS for word in words)
+
+    def reset_extraction_stats(self):
+        self.name_tiers = {'label': 0, 'header': 0, 'ner': 0, 'none': 0}
+        self.ner_calls = 0
+        self.ner_seconds = 0.0
+
+    def extraction_report(self):
+        """
+        Summarise which tier found the names and how much spaCy time was saved.
+        """
+        tiers = self.name_tiers
+        total = sum(tiers.values())
+        report = (
+            f"Names: {tiers['label']} from labels, {tiers['header']} from the header line, "
+            f"{tiers['ner']} from spaCy, {tiers['none']} not found."
+        )
+        skipped = total - self.ner_calls
+        if skipped and self.ner_calls:
+            saved = skipped * self.ner_seconds / self.ner_calls
+            report += f" spaCy skipped for {skipped} of {total} resumes (~{saved:.1f}s saved)."
+        elif skipped:
+            report += f" spaCy skipped for all {total} resumes."
+        return report
 
     def extract_name(self, doc):
         for ent in doc.ents:
@@ -246,10 +732,45 @@ def read_pdf(file):
         text += page.get_text()
     return text
 
+def load_nlp():
+    """
+    Load the spaCy pipeline used for name extraction. Frozen builds ship a
+    pruned NER-only copy of en_core_web_sm; otherwise the installed model is
+    loaded without the components we don't use.
+    """
+    import spacy  # Imported here because it is slow and not needed to show the window
+
+    bundle_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    model_dir = os.path.join(bundle_dir, NER_MODEL_DIR)
+    if os.path.isdir(model_dir):
+        return spacy.load(model_dir)
+    return spacy.load('en_core_web_sm', exclude=UNUSED_PIPES)
+
+def run_benchmark(window, sample_path):
+    """
+    Print when the window is up and when the first resume is parsed, then quit.
+    Used by build_slim.py to compare builds.
+    """
+    print(f"window_shown {time.time()}", flush=True)
+    with open(sample_path, 'r', encoding='utf-8') as file:
+        resume_text = file.read()
+    window.extract_resume_data(resume_text)
+    # The heuristics may have found the name already; still load and run spaCy
+    # so time-to-first-parse covers the model in every build
+    window.extract_name(window.nlp(resume_text))
+    print(f"first_parse {time.time()}", flush=True)
+    QApplication.quit()
+
 def main():
     app = QApplication(sys.argv)
     window = ResumeApp()
     window.show()
+
+    # RESUMEAPP_BENCH=<sample resume .txt> measures startup instead of running normally
+    sample_path = os.environ.get('RESUMEAPP_BENCH')
+    if sample_path:
+        QTimer.singleShot(0, lambda: run_benchmark(window, sample_path))
+
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
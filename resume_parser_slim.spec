@@ -0,0 +1,78 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Slim onedir build of resume_parser.py. Build with `python build_slim.py`,
+# which first writes the pruned NER-only model to build/ner_model.
+
+import os
+
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules, copy_metadata, get_package_paths
+
+block_cipher = None
+
+# Language packages other than English. They are excluded below, so the
+# spaCy hook from pyinstaller-hooks-contrib can't pull them back in.
+spacy_dir = get_package_paths('spacy')[1]
+other_languages = [
+    f'spacy.lang.{name}' for name in sorted(os.listdir(os.path.join(spacy_dir, 'lang')))
+    if name != 'en' and os.path.isdir(os.path.join(spacy_dir, 'lang', name)) and not name.startswith('_')
+]
+
+# spaCy and thinc register components through entry points and registries,
+# so their submodules have to be listed. Other languages are left out.
+hiddenimports = collect_submodules(
+    'spacy', filter=lambda name: not name.startswith('spacy.lang.') or name.startswith('spacy.lang.en')
+)
+hiddenimports += collect_submodules('thinc')
+hiddenimports += ['srsly.msgpack.util', 'cymem', 'preshed', 'blis', 'openpyxl']
+
+datas = [('build/ner_model', 'ner_model')]
+# spaCy's own data (default_config.cfg and friends) for English only
+datas += collect_data_files('spacy', excludes=['lang/**', 'tests/**'])
+datas += collect_data_files('spacy', includes=['lang/en/**'])
+datas += copy_metadata('spacy')
+datas += collect_data_files('thinc')
+
+# Heavy modules the app never imports
+excludes = [
+    'pyarrow', 'matplotlib', 'scipy', 'IPython', 'jupyter', 'notebook', 'tkinter',
+    'pytest', 'sqlalchemy', 'numba', 'torch', 'tensorflow', 'transformers',
+    'spacy_lookups_data', 'pandas.tests', 'numpy.tests', 'PyQt5.QtWebEngineWidgets',
+    'PyQt5.QtWebEngineCore', 'PyQt5.QtMultimedia', 'PyQt5.QtQml', 'PyQt5.QtQuick',
+    'PyQt5.QtNetwork', 'PyQt5.QtSql', 'PyQt5.QtTest', 'spacy.tests',
+] + other_languages
+
+a = Analysis(
+    ['resume_parser.py'],
+    pathex=[],
+    binaries=[],
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    runtime_hooks=[],
+    excludes=excludes,
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+)
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='resume_parser_slim',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    # UPX-compressed libraries have to be decompressed on every launch
+    upx=False,
+    console=True,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='resume_parser_slim',
+)
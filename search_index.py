@@ -0,0 +1,223 @@
+import os
+import re
+import sqlite3
+import argparse
+import time
+
+from db_sink import candidate_key
+
+# Index column -> sheet columns it is built from (resume_parser.py and drive.py layouts)
+FIELD_COLUMNS = {
+    'name': ['Name'],
+    'email': ['Email'],
+    'phone': ['Number', 'Phone'],
+    'location': ['Preferred Location', 'Location', 'Address', 'Pincode'],
+    'skills': ['Skills'],
+    'qualification': ['Qualification', 'Education'],
+    'specialization': ['Specialization'],
+    'college': ['College'],
+    'year': ['Passing Year', 'PassingYear'],
+    'experience': ['Experience', 'Sectors'],
+}
+
+# Relevance weight of a match in each column (same order as the table), then the full text
+WEIGHTS = [10.0, 5.0, 5.0, 3.0, 4.0, 2.0, 2.0, 2.0, 3.0, 1.5, 1.0]
+
+# Names accepted before ':' in queries
+FIELD_ALIASES = dict({field: field for field in FIELD_COLUMNS}, **{
+    'number': 'phone', 'city': 'location', 'skill': 'skills', 'degree': 'qualification',
+    'education': 'qualification', 'passing': 'year', 'text': 'text',
+})
+
+QUERY_TOKEN_PATTERN = re.compile(r'[A-Za-z_]+:(?=\S)|"[^"]*"|[()]|[^\s()"]+')
+
+
+def translate_query(query):
+    """
+    Turn a search box query into FTS5 syntax. Supports AND/OR/NOT (any case),
+    parentheses, "quoted phrases", prefix* terms and field:value filters,
+    e.g. skills:python AND location:bangalore AND year:2022
+    """
+    parts = []
+    for token in QUERY_TOKEN_PATTERN.findall(query):
+        if token.upper() in ('AND', 'OR', 'NOT'):
+            parts.append(token.upper())
+        elif token in ('(', ')'):
+            parts.append(token)
+        elif token.endswith(':'):
+            field = token[:-1].lower()
+            if field not in FIELD_ALIASES:
+                raise ValueError(f"Unknown field '{field}'. Use one of: {', '.join(sorted(FIELD_ALIASES))}")
+            parts.append(f'{FIELD_ALIASES[field]} :')
+        else:
+            # Quote every term so characters like - + . @ are not read as syntax
+            prefix = token.endswith('*')
+            term = token.rstrip('*').strip('"').replace('"', '""')
+            parts.append(f'"{term}"' + ('*' if prefix else ''))
+    return ' '.join(parts)
+
+
+class SearchIndex:
+    """
+    Persistent inverted index over ingested candidates (SQLite FTS5).
+
+    Candidates are added or replaced one at a time as resumes are ingested,
+    so the index never needs a full rebuild. Results are ranked with BM25,
+    weighting matches in the extracted fields above the full resume text.
+    """
+
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path, timeout=60)
+        columns = ', '.join(list(FIELD_COLUMNS) + ['text'])
+        self.conn.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS candidates (id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL);
+            CREATE VIRTUAL TABLE IF NOT EXISTS candidates_fts USING fts5({columns}, tokenize='unicode61');
+            """
+        )
+
+    def close(self):
+        self.conn.close()
+
+    def add_many(self, items):
+        """
+        Add or replace candidates in one transaction.
+        items are (key, row, resume_text) tuples; when resume_text is None the
+        text already indexed for that candidate is kept.
+        """
+        with self.conn:
+            for key, row, resume_text in items:
+                self.conn.execute('INSERT OR IGNORE INTO candidates (key) VALUES (?)', (key,))
+                doc_id = self.conn.execute('SELECT id FROM candidates WHERE key = ?', (key,)).fetchone()[0]
+                values = [self.field_text(row, columns) for columns in FIELD_COLUMNS.values()]
+                if resume_text is None:
+                    existing = self.conn.execute('SELECT text FROM candidates_fts WHERE rowid = ?', (doc_id,)).fetchone()
+                    resume_text = existing[0] if existing else None
+                self.conn.execute('DELETE FROM candidates_fts WHERE rowid = ?', (doc_id,))
+                self.conn.execute(
+                    f"INSERT INTO candidates_fts (rowid, {', '.join(FIELD_COLUMNS)}, text) "
+                    f"VALUES (?, {', '.join('?' for _ in range(len(FIELD_COLUMNS) + 1))})",
+                    [doc_id] + values + [resume_text or '']
+                )
+
+    def add(self, key, row, resume_text=None):
+        self.add_many([(key, row, resume_text)])
+
+    def rename(self, old_key, new_key):
+        """
+        Move a candidate to a new key (e.g. after its email was edited), keeping
+        its indexed resume text. If new_key is already indexed, old_key is dropped.
+        """
+        with self.conn:
+            old = self.conn.execute('SELECT id FROM candidates WHERE key = ?', (old_key,)).fetchone()
+            if old is None:
+                return
+            if self.conn.execute('SELECT 1 FROM candidates WHERE key = ?', (new_key,)).fetchone():
+                self.conn.execute('DELETE FROM candidates_fts WHERE rowid = ?', old)
+                self.conn.execute('DELETE FROM candidates WHERE id = ?', old)
+            else:
+                self.conn.execute('UPDATE candidates SET key = ? WHERE id = ?', (new_key, old[0]))
+
+    @staticmethod
+    def field_text(row, columns):
+        values = [row.get(column) for column in columns]
+        return ' '.join(str(value) for value in values if value is not None and value == value)
+
+    def search(self, query, limit=100):
+        """
+        Return the keys of the best matching candidates, best first.
+        """
+        return [key for key, *_ in self.search_details(query, limit)]
+
+    def search_details(self, query, limit=100, fields=('name', 'email', 'phone')):
+        """
+        Like search(), but returns (key, *field values) tuples so callers
+        without the sheet can show who matched.
+        """
+        fts_query = translate_query(query)
+        if not fts_query:
+            return []
+        columns = ''.join(f', candidates_fts.{field}' for field in fields)
+        try:
+            return self.conn.execute(
+                f'SELECT candidates.key{columns} FROM candidates_fts '
+                'JOIN candidates ON candidates.id = candidates_fts.rowid '
+                f"WHERE candidates_fts MATCH ? ORDER BY bm25(candidates_fts, {', '.join(map(str, WEIGHTS))}) LIMIT ?",
+                (fts_query, limit)
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {query} ({e})")
+
+    def count(self, query):
+        """
+        Number of candidates matching the query.
+        """
+        fts_query = translate_query(query)
+        if not fts_query:
+            return 0
+        try:
+            return self.conn.execute(
+                'SELECT COUNT(*) FROM candidates_fts WHERE candidates_fts MATCH ?', (fts_query,)
+            ).fetchone()[0]
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {query} ({e})")
+
+
+def row_key(row, position=None, file_path=None):
+    """
+    Index key of a candidate: the same email/phone/name key as the database
+    sink; otherwise the row's position in the sheet, or the resume file when
+    the position isn't known yet. Returns None if none of these is known.
+    """
+    key = candidate_key(row)
+    if key:
+        return key
+    if position is not None:
+        return f'row:{position}'
+    if file_path:
+        return 'file:' + os.path.abspath(file_path)
+    return None
+
+
+def index_sheet(index, excel_file_path, sheet_name):
+    """
+    Index the rows of an existing sheet (extracted fields only).
+    """
+    import pandas as pd
+
+    sheet_data = pd.read_excel(excel_file_path, sheet_name=sheet_name)
+    items = []
+    for position, row in enumerate(sheet_data.to_dict('records')):
+        items.append((row_key(row, position), row, None))
+    index.add_many(items)
+    return len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search ingested candidates.')
+    parser.add_argument('query', nargs='?', help='e.g. skills:python AND location:bangalore AND year:2022')
+    parser.add_argument('--index', default='candidates_index.sqlite', help='index file')
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--add-sheet', metavar='EXCEL', help='index the rows of an existing Excel sheet first')
+    parser.add_argument('--sheet-name', default='Sheet1')
+    args = parser.parse_args()
+
+    index = SearchIndex(args.index)
+    try:
+        if args.add_sheet:
+            print(f"Indexed {index_sheet(index, args.add_sheet, args.sheet_name)} rows from {args.add_sheet}")
+        if args.query:
+            start = time.perf_counter()
+            results = index.search_details(args.query, args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+            for rank, (key, name, email, phone) in enumerate(results, 1):
+                print(f"{rank:>3}. {name or '(no name)'} | {email or '-'} | {phone or '-'}")
+            print(f"{len(results)} results in {elapsed:.1f} ms")
+    except ValueError as e:
+        print(e)
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import time
+
+import pytest
+
+from job_queue import JobQueue, DONE, FAILED, LEASED, MERGED, PENDING
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / 'queue.sqlite')
+
+
+@pytest.fixture
+def workers(queue_path):
+    first = JobQueue(queue_path, lease_seconds=60, max_attempts=2, worker_id='host-a:1', merge_seconds=60)
+    second = JobQueue(queue_path, lease_seconds=60, max_attempts=2, worker_id='host-b:1', merge_seconds=60)
+    yield first, second
+    first.close()
+    second.close()
+
+
+def drain(queue):
+    while True:
+        job = queue.lease()
+        if job is None:
+            return
+        queue.complete(job[0], {'Email': job[1]})
+
+
+def test_enqueue_ignores_known_paths(workers):
+    first, second = workers
+    assert first.enqueue(['a.pdf', 'b.pdf']) == 2
+    assert second.enqueue(['b.pdf', 'c.pdf']) == 1
+    assert first.counts() == {PENDING: 3}
+
+
+def test_workers_never_lease_the_same_job(workers):
+    first, second = workers
+    first.enqueue(['a.pdf', 'b.pdf', 'c.pdf'])
+    leased = [first.lease(), second.lease(), first.lease()]
+    assert sorted(path for _, path in leased) == ['a.pdf', 'b.pdf', 'c.pdf']
+    assert first.lease() is None and second.lease() is None
+
+
+def test_expired_lease_moves_to_another_worker(queue_path):
+    first = JobQueue(queue_path, lease_seconds=0.05, worker_id='host-a:1')
+    second = JobQueue(queue_path, lease_seconds=60, worker_id='host-b:1')
+    first.enqueue(['a.pdf'])
+    job_id, _ = first.lease()
+    assert second.lease() is None
+
+    time.sleep(0.1)
+    assert second.lease() == (job_id, 'a.pdf')
+    # The first worker lost its lease, so its late result is rejected
+    assert not first.complete(job_id, {'Email': 'late'})
+    assert second.complete(job_id, {'Email': 'on time'})
+    assert second.counts() == {DONE: 1}
+    first.close()
+    second.close()
+
+
+def test_failures_are_retried_until_max_attempts(workers):
+    first, second = workers
+    first.enqueue(['a.pdf'])
+    job_id, _ = first.lease()
+    first.fail(job_id, 'unreadable')
+    assert first.counts() == {PENDING: 1}
+
+    job_id, _ = second.lease()
+    second.fail(job_id, 'unreadable')
+    assert first.counts() == {FAILED: 1}
+    assert first.lease() is None
+
+
+def test_release_does_not_count_an_attempt(workers):
+    first, second = workers
+    first.enqueue(['a.pdf'])
+    for _ in range(3):
+        job_id, _ = first.lease()
+        first.release(job_id)
+    assert second.lease() is not None
+    assert second.counts() == {LEASED: 1}
+
+
+def test_is_drained_waits_for_leased_jobs(workers):
+    first, second = workers
+    first.enqueue(['a.pdf', 'b.pdf'])
+    job_id, _ = second.lease()
+    drain(first)
+    assert not first.is_drained()
+    second.complete(job_id, {})
+    assert first.is_drained()
+
+
+def test_claimed_results_are_merged_once(workers):
+    first, second = workers
+    first.enqueue(['a.pdf', 'b.pdf'])
+    drain(first)
+
+    with first.claim_results() as results:
+        assert [result for _, result in results] == [{'Email': 'a.pdf'}, {'Email': 'b.pdf'}]
+        # Claimed jobs are not handed to another worker meanwhile
+        with second.claim_results() as other:
+            assert other == []
+    assert first.counts() == {MERGED: 2}
+    assert not second.has_results()
+
+
+def test_failed_merge_leaves_results_done(workers):
+    first, second = workers
+    first.enqueue(['a.pdf'])
+    drain(first)
+
+    with pytest.raises(RuntimeError):
+        with first.claim_results():
+            raise RuntimeError('workbook is open in Excel')
+    assert second.has_results()
+    with second.claim_results() as results:
+        assert len(results) == 1
+
+
+def test_merge_lock_is_exclusive(workers):
+    first, second = workers
+    with first.merge_lock() as first_locked:
+        assert first_locked
+        with second.merge_lock() as second_locked:
+            assert not second_locked
+    with second.merge_lock() as second_locked:
+        assert second_locked
+
+
+def test_merge_lock_waits_for_the_holder(workers):
+    first, second = workers
+    assert first.acquire_lock('merge', 0.2)
+    with second.merge_lock(wait_seconds=5, poll_seconds=0.05) as locked:
+        # The first worker's lock expired while the second was waiting
+        assert locked
+    assert first.acquire_lock('merge', 60)
+    first.release_lock('merge')